@@ -2,6 +2,16 @@ import pygame
 from pygame.math import Vector2
 from constants import *
 
+def draw_cannon(surface, base_pos, angle, scale=1.0):
+    length = max(1, round(CANNON_LENGTH * scale))
+    width = max(1, round(CANNON_WIDTH * scale))
+    cannon_rect = pygame.Rect(0, -width // 2, length, width)
+    cannon_surf = pygame.Surface((length, width), pygame.SRCALPHA)
+    pygame.draw.rect(cannon_surf, CANNON_COLOR, cannon_rect)
+    rotated_surf = pygame.transform.rotate(cannon_surf, -angle)
+    rotated_rect = rotated_surf.get_rect(center=(base_pos[0] * scale, base_pos[1] * scale))
+    surface.blit(rotated_surf, rotated_rect)
+
 class Cannon:
     def __init__(self, x, y):
         self.base_pos = Vector2(x, y)
@@ -16,12 +26,4 @@ class Cannon:
         self.angle = max(-180, min(0, self.angle))
 
     def get_end_pos(self):
-        return self.base_pos + Vector2(CANNON_LENGTH, 0).rotate(self.angle)
-
-    def draw(self, surface):
-        cannon_rect = pygame.Rect(0, -CANNON_WIDTH // 2, CANNON_LENGTH, CANNON_WIDTH)
-        cannon_surf = pygame.Surface((CANNON_LENGTH, CANNON_WIDTH), pygame.SRCALPHA)
-        pygame.draw.rect(cannon_surf, CANNON_COLOR, cannon_rect)
-        rotated_surf = pygame.transform.rotate(cannon_surf, -self.angle)
-        rotated_rect = rotated_surf.get_rect(center=self.base_pos)
-        surface.blit(rotated_surf, rotated_rect)
\ No newline at end of file
+        return self.base_pos + Vector2(CANNON_LENGTH, 0).rotate(self.angle)
\ No newline at end of file
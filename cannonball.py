@@ -1,8 +1,19 @@
+import numpy as np
 import pygame
 import pymunk
 from pygame.math import Vector2
 from constants import *
 
+def draw_cannonball(surface, x, y, scale=1.0):
+    pygame.draw.circle(surface, CANNONBALL_COLOR, (int(x * scale), int(y * scale)),
+                       max(1, round(CANNONBALL_RADIUS * scale)))
+
+def removal_mask(positions, velocities):
+    x, y = positions[:, 0], positions[:, 1]
+    resting = ((np.abs(velocities[:, 0]) < 1) & (np.abs(velocities[:, 1]) < 1) &
+               (y > HEIGHT - FLOOR_HEIGHT - CANNONBALL_RADIUS))
+    return (x < 0) | (x > WIDTH) | (y > HEIGHT) | resting
+
 class Cannonball:
     def __init__(self, pos, angle):
         self.body = pymunk.Body(1, pymunk.moment_for_circle(1, 0, CANNONBALL_RADIUS))
@@ -11,16 +22,7 @@ class Cannonball:
         self.shape.elasticity = 0.8
         self.shape.friction = 0.5
         self.shape.collision_type = 1
+        self.shape.filter = pymunk.ShapeFilter(categories=CANNONBALL_CATEGORY)
         
         force = Vector2(CANNON_FORCE, 0).rotate(angle)
-        self.body.apply_impulse_at_local_point((force.x, force.y))
-
-    def draw(self, surface):
-        pos = self.body.position
-        pygame.draw.circle(surface, CANNONBALL_COLOR, (int(pos.x), int(pos.y)), CANNONBALL_RADIUS)
-
-    def should_remove(self):
-        pos = self.body.position
-        velocity = self.body.velocity
-        return (pos.x < 0 or pos.x > WIDTH or pos.y > HEIGHT or 
-                (abs(velocity.x) < 1 and abs(velocity.y) < 1 and pos.y > HEIGHT - FLOOR_HEIGHT - CANNONBALL_RADIUS))
\ No newline at end of file
+        self.body.apply_impulse_at_local_point((force.x, force.y))
\ No newline at end of file
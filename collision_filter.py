@@ -0,0 +1,62 @@
+import pymunk
+from constants import *
+
+def filters_collide(a, b):
+    if a.group and a.group == b.group:
+        return False
+    return bool(a.categories & b.mask) and bool(b.categories & a.mask)
+
+class CollisionPolicy:
+    def __init__(self, sibling_filter=SIBLING_FILTER, sibling_time=SIBLING_FILTER_TIME,
+                 old_debris_filter=OLD_DEBRIS_FILTER):
+        self.sibling_filter = sibling_filter
+        self.sibling_time = sibling_time
+        self.old_debris_filter = old_debris_filter
+        self.next_group = 1
+        self.pending = []  # (expire_time, segments) for sibling groups that will be released
+        self.filtered_last_step = 0  # Upper bound on arbiters saved, see count_filtered
+        self.filtered_total = 0
+
+    def on_shatter(self, new_segments, old_segments, now):
+        if self.old_debris_filter:
+            old_filter = pymunk.ShapeFilter(categories=OLD_DEBRIS_CATEGORY,
+                                            mask=FLOOR_CATEGORY | CANNONBALL_CATEGORY)
+            for segment in old_segments:
+                segment.shape.filter = old_filter
+            self.pending = []
+
+        group = 0
+        if self.sibling_filter:
+            group = self.next_group
+            self.next_group += 1
+            if self.sibling_time is not None:
+                self.pending.append((now + self.sibling_time, new_segments))
+
+        new_filter = pymunk.ShapeFilter(group=group, categories=DEBRIS_CATEGORY)
+        for segment in new_segments:
+            segment.shape.filter = new_filter
+
+    def update(self, now):
+        while self.pending and self.pending[0][0] <= now:
+            _, segments = self.pending.pop(0)
+            for segment in segments:
+                current = segment.shape.filter
+                segment.shape.filter = pymunk.ShapeFilter(categories=current.categories, mask=current.mask)
+
+    def count_filtered(self, space, segments):
+        # Bounding-box overlaps involving debris that the filters reject. Not every overlap would have
+        # become a contact, so this is an upper bound on the arbiters the policy saves
+        unfiltered = pymunk.ShapeFilter()
+        shapes = {segment.shape for segment in segments}
+        seen = set()
+        filtered = 0
+        for shape in shapes:
+            seen.add(shape)
+            for other in space.bb_query(shape.bb, unfiltered):
+                if other is shape or other in seen:
+                    continue
+                if not filters_collide(shape.filter, other.filter):
+                    filtered += 1
+        self.filtered_last_step = filtered
+        self.filtered_total += filtered
+        return filtered
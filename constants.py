@@ -10,4 +10,26 @@ CANNONBALL_COLOR = (255, 255, 255)
 CANNON_ROTATION_SPEED = 2
 CANNON_MOVE_SPEED = 5
 CANNON_FORCE = 1000
-HEXAGON_RESPAWN_TIME = 1000
\ No newline at end of file
+HEXAGON_RESPAWN_TIME = 1000
+RENDER_SCALE = 1.0  # Internal render resolution relative to WIDTH, HEIGHT, e.g. 0.5 or 0.75
+GRAVITY = 900
+PARTICLE_SIZE_THRESHOLD = 40  # Fragments with this many pixels or fewer become particles
+PARTICLE_LIFETIME = 2.0
+PARTICLE_BOUNCE = 0.4
+PARTICLE_FRICTION = 0.8
+PARTICLE_JITTER = 5  # Max per-pixel velocity deviation from its fragment's velocity
+PHYSICS_THREADED = False  # Step physics on a worker thread and render its latest snapshot
+
+# Collision categories for pymunk ShapeFilter
+FLOOR_CATEGORY = 0b00001
+CANNONBALL_CATEGORY = 0b00010
+HEXAGON_CATEGORY = 0b00100
+DEBRIS_CATEGORY = 0b01000
+OLD_DEBRIS_CATEGORY = 0b10000
+SIBLING_FILTER = True  # Fragments from the same shatter ignore each other
+SIBLING_FILTER_TIME = 500  # Milliseconds before siblings collide again, None to never collide
+OLD_DEBRIS_FILTER = True  # Debris from earlier shatters only collides with the floor and cannonballs
+# Count debris bounding-box overlaps the filters reject every step. This is an upper bound on the
+# arbiters saved, not an exact count, and the extra bb_query per debris shape runs inside the
+# physics step (on the worker thread when PHYSICS_THREADED), so enabling it slows physics down
+COLLISION_STATS = False
@@ -0,0 +1,65 @@
+import numpy as np
+import pymunk.batch
+
+BODY_FIELDS = (pymunk.batch.BodyFields.BODY_ID | pymunk.batch.BodyFields.POSITION |
+               pymunk.batch.BodyFields.ANGLE | pymunk.batch.BodyFields.VELOCITY)
+
+class BodyBatch:
+    def __init__(self, space):
+        self.space = space
+        self.buffer = pymunk.batch.Buffer()
+
+    def gather(self):
+        # Copy every dynamic body into flat buffers in C, no per-body Python property reads
+        self.buffer.clear()
+        pymunk.batch.get_space_bodies(self.space, BODY_FIELDS, self.buffer)
+        float_buf = self.buffer.float_buf()
+        if len(float_buf) == 0:
+            return np.zeros(0, dtype=np.uintp), np.zeros((0, 5))
+        ids = np.frombuffer(self.buffer.int_buf(), dtype=np.uintp)
+        # Floats come in BodyFields order: position x, y, angle, velocity x, y
+        data = np.frombuffer(float_buf, dtype=np.float64).reshape(-1, 5)
+        order = np.argsort(ids)
+        return ids[order], data[order]
+
+class EntityState:
+    def __init__(self):
+        # Parallel lists, kept in the same order as self.ids and the arrays filled by sync()
+        self.entities = []
+        self.sprites = []
+        self.ids = np.zeros(0, dtype=np.uintp)
+        self.positions = np.zeros((0, 2))
+        self.velocities = np.zeros((0, 2))
+        self.angles = np.zeros(0)
+
+    def __len__(self):
+        return len(self.entities)
+
+    def add(self, entities):
+        entities = list(entities)
+        self.entities.extend(entities)
+        self.sprites.extend(getattr(entity, "sprite", None) for entity in entities)
+        self.ids = np.concatenate([self.ids, np.array([entity.body.id for entity in entities], dtype=np.uintp)])
+
+    def sync(self, ids, data):
+        # ids is sorted, as returned by BodyBatch.gather
+        rows = data[np.searchsorted(ids, self.ids)]
+        rows.flags.writeable = False  # Shared with render snapshots
+        self.positions = rows[:, 0:2]
+        self.angles = rows[:, 2]
+        self.velocities = rows[:, 3:5]
+
+    def cull(self, mask):
+        indices = np.flatnonzero(mask)
+        if len(indices) == 0:
+            return []
+        removed = [self.entities[i] for i in indices]
+        for i in indices[::-1]:
+            del self.entities[i]
+            del self.sprites[i]
+        keep = ~mask
+        self.ids = self.ids[keep]
+        self.positions = self.positions[keep]
+        self.velocities = self.velocities[keep]
+        self.angles = self.angles[keep]
+        return removed
@@ -1,28 +1,57 @@
+import queue
 import pygame
 import pymunk
 from constants import *
-from cannon import Cannon
+from cannon import Cannon, draw_cannon
 from hexagon import Hexagon
-from cannonball import Cannonball
-from segment import Segment
+from cannonball import Cannonball, draw_cannonball, removal_mask as cannonball_removal_mask
+from segment import Segment, draw_segment, removal_mask as segment_removal_mask
+from particles import ParticleSystem, draw_particles
+from physics_worker import PhysicsWorker, Snapshot
+from entity_state import BodyBatch, EntityState
+from collision_filter import CollisionPolicy
 
 class Game:
-    def __init__(self, screen):
+    def __init__(self, screen, render_scale=RENDER_SCALE, threaded=PHYSICS_THREADED):
         self.screen = screen
+        self.render_scale = render_scale
+        if render_scale == 1.0:
+            self.canvas = screen
+        else:
+            # Render the world at reduced resolution and upscale once per frame
+            self.canvas = pygame.Surface((int(WIDTH * render_scale), int(HEIGHT * render_scale))).convert()
         self.space = pymunk.Space()
-        self.space.gravity = (0, 900)
+        self.space.gravity = (0, GRAVITY)
         
         self.create_floor()
         self.cannon = Cannon(WIDTH // 2, HEIGHT - FLOOR_HEIGHT)
-        self.hexagon = Hexagon(self.space)
-        self.cannonballs = []
-        self.all_segments = []
+        self.particles = ParticleSystem()
+        self.hexagon = Hexagon(self.space, self.particles, self.render_scale)
+        self.body_batch = BodyBatch(self.space)
+        self.cannonball_state = EntityState()
+        self.segment_state = EntityState()
+        self.cannonballs = self.cannonball_state.entities
+        self.all_segments = self.segment_state.entities
+        self.collision_policy = CollisionPolicy()
 
         self.setup_collision_handler()  # Initialize all_segments here
 
+        # Input and collision side effects are applied by whichever thread steps the space
+        self.commands = queue.SimpleQueue()
+        self.worker = PhysicsWorker(self) if threaded else None
+
+    def start(self):
+        if self.worker:
+            self.worker.start()
+
+    def stop(self):
+        if self.worker:
+            self.worker.stop()
+
     def create_floor(self):
         floor_shape = pymunk.Segment(self.space.static_body, (0, HEIGHT - FLOOR_HEIGHT), (WIDTH, HEIGHT - FLOOR_HEIGHT), 5)
         floor_shape.friction = 0.4
+        floor_shape.filter = pymunk.ShapeFilter(categories=FLOOR_CATEGORY)
         self.space.add(floor_shape)
 
     def setup_collision_handler(self):
@@ -31,62 +60,110 @@ class Game:
 
     def on_collision(self, arbiter, space, data):
         if not self.hexagon.shattered:
-            new_segments = self.hexagon.shatter()
-            self.all_segments.extend(new_segments)
+            self.commands.put(("shatter",))
         return True
 
     def update(self):
         keys = pygame.key.get_pressed()
         if keys[pygame.K_LEFT]:
-            self.cannon.move(-1)
+            self.commands.put(("move", -1))
         if keys[pygame.K_RIGHT]:
-            self.cannon.move(1)
+            self.commands.put(("move", 1))
         if keys[pygame.K_UP]:
-            self.cannon.rotate(-1)
+            self.commands.put(("rotate", -1))
         if keys[pygame.K_DOWN]:
-            self.cannon.rotate(1)
+            self.commands.put(("rotate", 1))
 
-        #self.hexagon.update()
+        if not self.worker:
+            self.step(1/60.0)
+
+    def process_commands(self):
+        while True:
+            try:
+                command, *args = self.commands.get_nowait()
+            except queue.Empty:
+                return
+            if command == "move":
+                self.cannon.move(*args)
+            elif command == "rotate":
+                self.cannon.rotate(*args)
+            elif command == "fire":
+                self.fire_cannonball()
+            elif command == "shatter" and not self.hexagon.shattered:
+                new_segments = self.hexagon.shatter()
+                self.collision_policy.on_shatter(new_segments, self.all_segments, pygame.time.get_ticks())
+                self.segment_state.add(new_segments)
+
+    def step(self, dt):
+        # Cull against the arrays from the previous sync, before any new entities are added
         self.update_cannonballs()
         self.update_segments()
+        self.process_commands()
+
+        #self.hexagon.update()
         
         if self.hexagon.should_respawn():
-            self.hexagon = Hexagon(self.space)
+            self.hexagon = Hexagon(self.space, self.particles, self.render_scale)
 
-        self.space.step(1/60.0)
+        self.collision_policy.update(pygame.time.get_ticks())
+        self.space.step(dt)
+        ids, data = self.body_batch.gather()
+        self.cannonball_state.sync(ids, data)
+        self.segment_state.sync(ids, data)
+        if COLLISION_STATS:
+            self.collision_policy.count_filtered(self.space, self.all_segments)
+        self.particles.update(dt)
 
     def update_segments(self):
-        for segment in self.all_segments[:]:
-            if segment.should_remove():
-                self.space.remove(segment.body, segment.shape)
-                self.all_segments.remove(segment)
+        state = self.segment_state
+        for removed in state.cull(segment_removal_mask(state.positions)):
+            self.space.remove(removed.body, removed.shape)
 
     def update_cannonballs(self):
-        for cannonball in self.cannonballs[:]:
-            if cannonball.should_remove():
-                self.space.remove(cannonball.body, cannonball.shape)
-                self.cannonballs.remove(cannonball)
+        state = self.cannonball_state
+        for removed in state.cull(cannonball_removal_mask(state.positions, state.velocities)):
+            self.space.remove(removed.body, removed.shape)
+
+    def take_snapshot(self):
+        hexagon = self.hexagon
+        count = self.particles.count
+        return Snapshot((self.cannon.base_pos.x, self.cannon.base_pos.y), self.cannon.angle,
+                        None if hexagon.shattered else hexagon.draw_surface, hexagon.position,
+                        tuple(self.segment_state.sprites), self.segment_state.positions, self.segment_state.angles,
+                        self.cannonball_state.positions,
+                        self.particles.positions[:count].copy(), self.particles.colors[:count].copy())
 
     def draw(self):
-        self.screen.fill(BLACK)
-        pygame.draw.rect(self.screen, FLOOR_COLOR, (0, HEIGHT - FLOOR_HEIGHT, WIDTH, FLOOR_HEIGHT))
+        snapshot = self.worker.latest() if self.worker else self.take_snapshot()
+        canvas = self.canvas
+        scale = self.render_scale
+        canvas.fill(BLACK)
+        floor_top = int((HEIGHT - FLOOR_HEIGHT) * scale)
+        pygame.draw.rect(canvas, FLOOR_COLOR, (0, floor_top, canvas.get_width(), canvas.get_height() - floor_top))
         
-        self.hexagon.draw(self.screen)
-        for segment in self.all_segments:
-            segment.draw(self.screen)
+        if snapshot.hexagon_surface is not None:
+            x, y = snapshot.hexagon_position
+            canvas.blit(snapshot.hexagon_surface, (int(x * scale), int(y * scale)))
+        for sprite, (x, y), angle in zip(snapshot.segment_sprites, snapshot.segment_positions.tolist(),
+                                         snapshot.segment_angles.tolist()):
+            draw_segment(canvas, sprite, x, y, angle, scale)
+        draw_particles(canvas, snapshot.particle_positions, snapshot.particle_colors, scale)
         
-        self.cannon.draw(self.screen)
+        draw_cannon(canvas, snapshot.cannon_pos, snapshot.cannon_angle, scale)
         
-        for cannonball in self.cannonballs:
-            cannonball.draw(self.screen)
+        for x, y in snapshot.cannonball_positions.tolist():
+            draw_cannonball(canvas, x, y, scale)
+
+        if canvas is not self.screen:
+            pygame.transform.scale(canvas, self.screen.get_size(), self.screen)
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
-                self.fire_cannonball()
+                self.commands.put(("fire",))
 
     def fire_cannonball(self):
         end_pos = self.cannon.get_end_pos()
         cannonball = Cannonball(end_pos, self.cannon.angle)
         self.space.add(cannonball.body, cannonball.shape)
-        self.cannonballs.append(cannonball)
\ No newline at end of file
+        self.cannonball_state.add([cannonball])
\ No newline at end of file
@@ -9,8 +9,10 @@ from segment import Segment
 from geometry_utils import simplify_polygon
 
 class Hexagon:
-    def __init__(self, space):
+    def __init__(self, space, particles=None, render_scale=1.0):
         self.space = space
+        self.particles = particles
+        self.render_scale = render_scale
         self.load_random_hexagon()
         self.create_body()
         self.shattered = False
@@ -32,6 +34,7 @@ class Hexagon:
             new_size = (int(original_hexagon.get_width() * scale_factor), 
                         int(original_hexagon.get_height() * scale_factor))
             self.surface = pygame.transform.scale(original_hexagon, new_size)
+            self.draw_surface = self.scale_for_render(self.surface)
             
             # Create a mask from the surface to get the actual shape
             self.mask = pygame.mask.from_surface(self.surface)
@@ -50,11 +53,22 @@ class Hexagon:
             # Fallback to a colored surface if image loading fails
             self.surface = pygame.Surface((100, 100), pygame.SRCALPHA)
             pygame.draw.polygon(self.surface, (255, 0, 0), self.get_hexagon_points(50))
+            self.draw_surface = self.scale_for_render(self.surface)
             self.mask = pygame.mask.from_surface(self.surface)
             self.bbox = self.mask.get_bounding_rects()[0]
             self.position = (WIDTH // 2 - 50, HEIGHT // 2 - FLOOR_HEIGHT - 50)
             self.rect = self.surface.get_rect(topleft=self.position)
 
+    def scale_for_render(self, source):
+        # Prepare the sprite once at the internal render resolution, scaled the same
+        # way as the Segment sprites so the hexagon doesn't change look when it shatters
+        if self.render_scale == 1.0:
+            # segment_hexagon flood-fills self.surface, so never share it with the renderer
+            return source.copy()
+        new_size = (max(1, round(source.get_width() * self.render_scale)),
+                    max(1, round(source.get_height() * self.render_scale)))
+        return pygame.transform.scale(source, new_size)
+
     def get_hexagon_points(self, radius):
         points = []
         for i in range(6):
@@ -73,6 +87,7 @@ class Hexagon:
         
         self.shape = pymunk.Poly(self.body, simplified_outline)
         self.shape.collision_type = 2
+        self.shape.filter = pymunk.ShapeFilter(categories=HEXAGON_CATEGORY)
         self.space.add(self.body, self.shape)
 
     def shatter(self):
@@ -118,7 +133,12 @@ class Hexagon:
                     filled_pixels = self.flood_fill(self.surface, (x, y), color, (0, 0, 0, 0))
                     visited.update(filled_pixels)
 
-                    if len(filled_pixels) > 10:  # Ignore very small segments
+                    if len(filled_pixels) <= PARTICLE_SIZE_THRESHOLD:
+                        # Tiny fragments are cosmetic, so keep them out of the physics solver
+                        if self.particles is not None:
+                            self.particles.emit([(px + self.rect.left, py + self.rect.top)
+                                                 for px, py in filled_pixels], color)
+                    else:
                         min_x = min(p[0] for p in filled_pixels)
                         min_y = min(p[1] for p in filled_pixels)
                         max_x = max(p[0] for p in filled_pixels)
@@ -133,7 +153,8 @@ class Hexagon:
 
                         center = Vector2(bounding_rect.center) + Vector2(self.rect.topleft)
                         center_tuple = (center.x, center.y)
-                        segments.append(Segment(center_tuple, color, segment_surface, bounding_rect))
+                        segments.append(Segment(center_tuple, color, segment_surface, bounding_rect,
+                                                self.render_scale))
 
         return segments
 
@@ -146,11 +167,4 @@ class Hexagon:
         self.segments = []
 
     def should_respawn(self):
-        return self.shattered and pygame.time.get_ticks() >= self.respawn_time
-
-    def draw(self, surface):
-        if not self.shattered:
-            surface.blit(self.surface, self.position)
-        else:
-            for segment in self.segments:
-                segment.draw(surface)
\ No newline at end of file
+        return self.shattered and pygame.time.get_ticks() >= self.respawn_time
\ No newline at end of file
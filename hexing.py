@@ -1,7 +1,7 @@
 import pygame
 import sys
 from game import Game
-from constants import WIDTH, HEIGHT
+from constants import WIDTH, HEIGHT, COLLISION_STATS
 
 def main():
     pygame.init()
@@ -9,11 +9,13 @@ def main():
     pygame.display.set_caption("Hexagon Shatter")
     
     game = Game(screen)
+    game.start()
     clock = pygame.time.Clock()
 
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                game.stop()
                 pygame.quit()
                 sys.exit()
             game.handle_event(event)
@@ -24,5 +26,10 @@ def main():
         pygame.display.flip()
         clock.tick(60)
 
+        if COLLISION_STATS:
+            policy = game.collision_policy
+            pygame.display.set_caption(f"Hexagon Shatter - arbiters saved (upper bound): "
+                                       f"<={policy.filtered_last_step}/step, <={policy.filtered_total} total")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,85 @@
+import numpy as np
+import pygame
+from constants import *
+
+def draw_particles(surface, positions, colors, scale=1.0):
+    if len(positions) == 0:
+        return
+    xs = (positions[:, 0] * scale).astype(np.intp)
+    ys = (positions[:, 1] * scale).astype(np.intp)
+    width, height = surface.get_size()
+    visible = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+
+    # One batched write into the locked surface instead of a set_at per particle
+    pixels = pygame.surfarray.pixels3d(surface)
+    pixels[xs[visible], ys[visible]] = colors[visible]
+    del pixels
+
+class ParticleSystem:
+    def __init__(self, capacity=1024):
+        # Struct-of-arrays buffers, only the first self.count entries are live
+        self.positions = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float32)
+        self.colors = np.zeros((capacity, 3), dtype=np.uint8)
+        self.lifetimes = np.zeros(capacity, dtype=np.float32)
+        self.count = 0
+
+    def reserve(self, capacity):
+        if capacity <= len(self.lifetimes):
+            return
+        new_capacity = max(capacity, len(self.lifetimes) * 2)
+        for name in ("positions", "velocities", "colors", "lifetimes"):
+            old = getattr(self, name)
+            new = np.zeros((new_capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def emit(self, positions, color, lifetime=PARTICLE_LIFETIME):
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        n = len(positions)
+        if n == 0:
+            return
+        self.reserve(self.count + n)
+        start, end = self.count, self.count + n
+
+        self.positions[start:end] = positions
+        # One velocity per fragment, with the same spread as the random impulse applied
+        # to a unit-mass Segment, so its pixels fly off together as a chip
+        velocity = (np.random.uniform(-100, 100), np.random.uniform(-100, 0))
+        self.velocities[start:end] = velocity
+        self.velocities[start:end] += np.random.uniform(-PARTICLE_JITTER, PARTICLE_JITTER, (n, 2))
+        self.colors[start:end] = color[:3]
+        self.lifetimes[start:end] = lifetime * np.random.uniform(0.75, 1.25)
+        self.count = end
+
+    def update(self, dt):
+        if self.count == 0:
+            return
+        n = self.count
+        pos = self.positions[:n]
+        vel = self.velocities[:n]
+
+        vel[:, 1] += GRAVITY * dt
+        pos += vel * dt
+
+        floor_y = HEIGHT - FLOOR_HEIGHT - 1
+        hit_floor = pos[:, 1] > floor_y
+        pos[hit_floor, 1] = floor_y
+        vel[hit_floor, 1] *= -PARTICLE_BOUNCE
+        vel[hit_floor, 0] *= PARTICLE_FRICTION
+
+        self.lifetimes[:n] -= dt
+        alive = ((self.lifetimes[:n] > 0) &
+                 (pos[:, 0] >= 0) & (pos[:, 0] < WIDTH) & (pos[:, 1] >= 0))
+        if not alive.all():
+            self.compact(alive)
+
+    def compact(self, alive):
+        n = np.count_nonzero(alive)
+        for name in ("positions", "velocities", "colors", "lifetimes"):
+            buf = getattr(self, name)
+            buf[:n] = buf[:self.count][alive]
+        self.count = n
+
+    def clear(self):
+        self.count = 0
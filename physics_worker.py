@@ -0,0 +1,56 @@
+import threading
+import time
+from collections import namedtuple
+
+# Immutable per-step view of the world, safe to render while the next step runs
+Snapshot = namedtuple("Snapshot", ["cannon_pos", "cannon_angle", "hexagon_surface", "hexagon_position",
+                                   "segment_sprites", "segment_positions", "segment_angles",
+                                   "cannonball_positions", "particle_positions", "particle_colors"])
+
+class PhysicsWorker(threading.Thread):
+    def __init__(self, game, step_rate=60):
+        super().__init__(daemon=True)
+        self.game = game
+        self.dt = 1 / step_rate
+        self.running = True
+        self.error = None
+        self.buffers = [game.take_snapshot(), None]
+        self.front = 0
+        self.lock = threading.Lock()
+
+    def publish(self, snapshot):
+        back = 1 - self.front
+        self.buffers[back] = snapshot
+        with self.lock:
+            self.front = back
+
+    def latest(self):
+        if self.error is not None:
+            # Surface worker failures on the main thread instead of freezing on the last frame
+            raise self.error
+        with self.lock:
+            return self.buffers[self.front]
+
+    def run(self):
+        next_time = time.perf_counter()
+        while self.running:
+            try:
+                self.game.step(self.dt)
+                self.publish(self.game.take_snapshot())
+            except Exception as e:
+                self.error = e
+                self.running = False
+                return
+
+            next_time += self.dt
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind, don't try to catch up with a burst of steps
+                next_time = time.perf_counter()
+
+    def stop(self):
+        self.running = False
+        if self.is_alive():
+            self.join()
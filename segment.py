@@ -5,11 +5,20 @@ import random
 from constants import *
 from geometry_utils import simplify_polygon
 
+def draw_segment(surface, sprite, x, y, angle, scale=1.0):
+    rotated_surface = pygame.transform.rotate(sprite, -math.degrees(angle))
+    surface.blit(rotated_surface, rotated_surface.get_rect(center=(int(x * scale), int(y * scale))))
+
+def removal_mask(positions):
+    x, y = positions[:, 0], positions[:, 1]
+    return (y > HEIGHT + 100) | (x < -100) | (x > WIDTH + 100)
+
 class Segment:
-    def __init__(self, pos, color, pixels, bounding_rect):
+    def __init__(self, pos, color, pixels, bounding_rect, render_scale=1.0):
         self.color = color
         self.pixels = pixels
         self.bounding_rect = bounding_rect
+        self.sprite = self.create_sprite(render_scale)
         
         mass = 1
         moment = pymunk.moment_for_box(mass, (bounding_rect.width, bounding_rect.height))
@@ -24,6 +33,7 @@ class Segment:
         
         self.shape.friction = 0.5
         self.shape.elasticity = 0.3
+        self.shape.filter = pymunk.ShapeFilter(categories=DEBRIS_CATEGORY)
 
         # Apply a random initial velocity
         impulse = pygame.math.Vector2(random.uniform(-100, 100), random.uniform(-100, 0))
@@ -40,16 +50,14 @@ class Segment:
                     points.append((x - self.bounding_rect.width // 2, y - self.bounding_rect.height // 2))
         return simplify_polygon(points)
 
-    def draw(self, surface):
-        rotated_surface = pygame.Surface(self.bounding_rect.size, pygame.SRCALPHA)
+    def create_sprite(self, render_scale):
+        sprite = pygame.Surface(self.bounding_rect.size, pygame.SRCALPHA)
         for y, row in enumerate(self.pixels):
             for x, pixel in enumerate(row):
                 if pixel:
-                    rotated_surface.set_at((x, y), self.color)
-        rotated_surface = pygame.transform.rotate(rotated_surface, -math.degrees(self.body.angle))
-        pos = self.body.position
-        surface.blit(rotated_surface, rotated_surface.get_rect(center=(int(pos.x), int(pos.y))))
-
-    def should_remove(self):
-        pos = self.body.position
-        return pos.y > HEIGHT + 100 or pos.x < -100 or pos.x > WIDTH + 100
\ No newline at end of file
+                    sprite.set_at((x, y), self.color)
+        if render_scale != 1.0:
+            new_size = (max(1, round(self.bounding_rect.width * render_scale)),
+                        max(1, round(self.bounding_rect.height * render_scale)))
+            sprite = pygame.transform.scale(sprite, new_size)
+        return sprite
\ No newline at end of file